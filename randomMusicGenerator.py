@@ -13,7 +13,7 @@ some "holy random" method calls, and we let
 the illusions guide us.
 
 Install dependencies:
-    pip install mido
+    pip install numpy numba
 
 Run:
     python3 randomMusicGenerator.py
@@ -22,9 +22,12 @@ Good luck, mortal!
 """
 
 import os
-import random
 import math
-from mido import Message, MidiFile, MidiTrack, MetaMessage
+import struct
+import functools
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit
 
 #####################################
 # GLOBALS
@@ -51,51 +54,68 @@ DRUM_NOTES = [35, 36, 38, 40, 41, 42, 43, 46, 49, 51, 57]  # Kicks, snares, hats
 #####################################
 # HELPER FUNCTIONS
 #####################################
+_NOTE_MAP = {
+    'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3,
+    'E': 4, 'F': 5, 'F#': 6, 'Gb': 6, 'G': 7, 'G#': 8, 'Ab': 8,
+    'A': 9, 'A#': 10, 'Bb': 10, 'B': 11
+}
+
+@functools.lru_cache(maxsize=None)
 def note_name_to_midi(note_name="C", octave=4):
     """Return MIDI note number for e.g. 'C' or 'D#' plus octave."""
-    note_map = {
-        'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3,
-        'E': 4, 'F': 5, 'F#': 6, 'Gb': 6, 'G': 7, 'G#': 8, 'Ab': 8,
-        'A': 9, 'A#': 10, 'Bb': 10, 'B': 11
-    }
-    base = note_map.get(note_name, 0)
+    base = _NOTE_MAP.get(note_name, 0)
     return 12 * (octave + 1) + base
 
-def add_program_change(track, program_num=0, channel=0, time=0):
-    """Set the instrument (Program Change) for a given channel."""
-    track.append(Message('program_change', program=program_num, channel=channel, time=time))
+def write_vlq(value, out):
+    """Append a MIDI variable-length quantity (7 bits per byte, MSB first)."""
+    parts = [value & 0x7F]
+    value >>= 7
+    while value:
+        parts.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.extend(reversed(parts))
 
-def add_note(track_events, note, velocity, start_tick, duration_ticks, channel=0):
-    """Add note_on/note_off events to a list, with absolute times."""
-    track_events.append((start_tick, 'note_on', note, velocity, channel))
-    off_tick = start_tick + duration_ticks
-    track_events.append((off_tick, 'note_off', note, velocity, channel))
+def add_program_change(buf, program_num=0, channel=0, time=0):
+    """Set the instrument (Program Change) for a given channel."""
+    write_vlq(time, buf)
+    buf.append(0xC0 | channel)
+    buf.append(program_num)
 
 def l_system(axiom, rules, depth):
-    """Generate a string using an L-system. We'll use it for durations or patterns."""
-    cur = axiom
+    """Expand an L-system over small-int symbol codes. We'll use it for
+    durations or patterns. `axiom` is a sequence of symbol codes, `rules` a
+    list of int8 replacement arrays indexed by symbol; each generation is
+    sized up front and written into one preallocated array — no string
+    concatenation, no per-char Python objects."""
+    cur = np.asarray(axiom, dtype=np.int8)
+    lengths = np.array([len(r) for r in rules], dtype=np.int64)
     for _ in range(depth):
-        new_string = []
-        for c in cur:
-            new_string.append(rules[c] if c in rules else c)
-        cur = "".join(new_string)
+        out = np.empty(int(lengths[cur].sum()), dtype=np.int8)
+        idx = 0
+        for s in cur:
+            r = rules[s]
+            out[idx:idx + len(r)] = r
+            idx += len(r)
+        cur = out
     return cur
 
 #####################################
 # RANDOM CHORD PROGRESSIONS
 #####################################
-def get_random_chord_progression(num_chords=8):
+def get_random_chord_progression(num_chords=8, rng=None):
     """
     We’ll pick a random key note, random scale type (major/minor),
     and create random triads for a certain # of chords.
     Absolutely unhinged.
     """
+    if rng is None:
+        rng = np.random.default_rng()
     # Let’s pick a random root note
     note_names = ['C','C#','D','D#','E','F','F#','G','G#','A','A#','B']
-    root_choice = random.choice(note_names)
+    root_choice = str(rng.choice(note_names))
     # Random octave for chord root
-    octave_choice = random.randint(2, 5)
-    
+    octave_choice = int(rng.integers(2, 6))
+
     # Random scale pattern (major or minor)
     # We might do exotic modes if we’re feeling even wilder
     possible_modes = {
@@ -104,257 +124,345 @@ def get_random_chord_progression(num_chords=8):
         'phrygian': [0, 1, 3, 5, 7, 8, 10],
         'lydian': [0, 2, 4, 6, 7, 9, 11]
     }
-    mode_name = random.choice(list(possible_modes.keys()))
-    intervals = possible_modes[mode_name]
-
-    def build_triads(base_note_midi):
-        # random choose major or minor triad for “spice”
-        if random.random() < 0.5:
-            # major triad intervals
-            return [base_note_midi, base_note_midi + 4, base_note_midi + 7]
-        else:
-            # minor triad intervals
-            return [base_note_midi, base_note_midi + 3, base_note_midi + 7]
-    
+    mode_name = str(rng.choice(list(possible_modes.keys())))
+    intervals = np.asarray(possible_modes[mode_name], dtype=np.int32)
+
     base_root_midi = note_name_to_midi(root_choice, octave_choice)
-    
-    chords = []
-    for _ in range(num_chords):
-        # pick random interval in the scale
-        interval = random.choice(intervals)
-        chord_root = base_root_midi + interval
-        triad = build_triads(chord_root)
-        chords.append(triad)
-    
+
+    # Draw every chord root interval in one batch, then stack the
+    # root/third/fifth columns. Random major-or-minor third for “spice”.
+    roots = base_root_midi + rng.choice(intervals, size=num_chords)
+    thirds = np.where(rng.random(num_chords) < 0.5, 4, 3)
+    chords = np.stack([roots, roots + thirds, roots + 7], axis=1).astype(np.int32)
+
     return chords, f"{root_choice}{octave_choice} {mode_name}"
 
 #####################################
 # RANDOM DRUM CHAOS
 #####################################
-def create_drum_track_chaos(num_measures, beats_per_measure, ticks_per_beat):
+def create_drum_track_chaos(num_measures, beats_per_measure, ticks_per_beat, seed=None):
     """
     Polyrhythms? Sure, we’ll do random hits at random times.
     Let’s also include a base pattern for some measure of structure.
-    Then we’ll add random hits.
+    All the randomness is drawn in a few NumPy batch calls instead of
+    a per-measure Python loop, so thousands of measures stay cheap.
     """
-    track_events = []
-    total_ticks = num_measures * beats_per_measure * ticks_per_beat
-    
-    # We'll drop at least one "structured" hit (kick on beat 0, snare on beat 2) if 4/4
-    # Then add random hits around it
-    for measure_idx in range(num_measures):
-        measure_start = measure_idx * beats_per_measure * ticks_per_beat
-        # Basic “kick/snare” structure for 4/4:
-        # Kick at beat 0, snare at beat 2
-        if beats_per_measure == 4:
-            # Kick
-            add_note(track_events, 36, 100,
-                     measure_start, int(0.1*ticks_per_beat), channel=9)
-            # Snare
-            snare_beat_2 = measure_start + 2 * ticks_per_beat
-            add_note(track_events, 38, 100,
-                     snare_beat_2, int(0.1*ticks_per_beat), channel=9)
-        
-        # now random hits:
-        random_hits = random.randint(2, 8)  # how many random hits per measure
-        for _ in range(random_hits):
-            random_drum_note = random.choice(DRUM_NOTES)
-            random_beat_offset = random.random() * beats_per_measure
-            start_t = measure_start + int(random_beat_offset * ticks_per_beat)
-            dur_t = int(0.1 * ticks_per_beat)
-            velocity = random.randint(40, 120)
-            add_note(track_events, random_drum_note, velocity, start_t, dur_t, channel=9)
-    
-    return track_events
+    rng = np.random.default_rng(seed)
+    measure_ticks = beats_per_measure * ticks_per_beat
+    hit_dur = int(0.1 * ticks_per_beat)
+
+    # Draw every random hit for the whole piece at once:
+    # counts, notes, offsets and velocities as flat arrays.
+    hits_per_measure = rng.integers(2, 9, size=num_measures)
+    total_hits = int(hits_per_measure.sum())
+    hit_notes = rng.choice(DRUM_NOTES, total_hits)
+    hit_offsets = rng.random(total_hits) * beats_per_measure
+    hit_vels = rng.integers(40, 121, total_hits)
+
+    # each hit starts at its measure start plus its random beat offset
+    measure_starts = np.repeat(np.arange(num_measures) * measure_ticks,
+                               hits_per_measure)
+    start_ticks = measure_starts + (hit_offsets * ticks_per_beat).astype(np.int64)
+
+    # The event count is known exactly once the hit counts are drawn, so
+    # allocate the columns once and fill them by slice — no concatenation.
+    n_struct = num_measures * 2 if beats_per_measure == 4 else 0  # kick + snare
+    n_events = 2 * (total_hits + n_struct)
+    tick = np.empty(n_events, np.int32)
+    kind = np.empty(n_events, np.int8)
+    note = np.empty(n_events, np.int8)
+    vel = np.empty(n_events, np.int8)
+
+    tick[:total_hits] = start_ticks
+    tick[total_hits:2 * total_hits] = start_ticks + hit_dur
+    kind[:total_hits] = 0
+    kind[total_hits:2 * total_hits] = 1
+    note[:total_hits] = hit_notes
+    note[total_hits:2 * total_hits] = hit_notes
+    vel[:total_hits] = hit_vels
+    vel[total_hits:2 * total_hits] = hit_vels
+
+    # Basic “kick/snare” structure for 4/4:
+    # Kick at beat 0, snare at beat 2, every measure
+    if beats_per_measure == 4:
+        kick_ticks = np.arange(num_measures) * measure_ticks
+        snare_ticks = kick_ticks + 2 * ticks_per_beat
+        pos = 2 * total_hits
+        for struct_ticks, drum_note in ((kick_ticks, 36), (snare_ticks, 38)):
+            on = slice(pos, pos + num_measures)
+            off = slice(pos + num_measures, pos + 2 * num_measures)
+            tick[on] = struct_ticks
+            tick[off] = struct_ticks + hit_dur
+            kind[on] = 0
+            kind[off] = 1
+            note[pos:pos + 2 * num_measures] = drum_note
+            vel[pos:pos + 2 * num_measures] = 100
+            pos += 2 * num_measures
+
+    # The random hits land out of tick order, so sort here (one stable
+    # C-level argsort) — every generator returns tick-sorted columns and
+    # the writer doesn't have to sort at all.
+    order = np.argsort(tick, kind='stable')
+    return tick[order], kind[order], note[order], vel[order], 9
 
 #####################################
 # CHAOTIC BASS TRACK
 #####################################
-def create_bass_track_chaos(chords, beats_per_chord, ticks_per_beat):
+def create_bass_track_chaos(chords, beats_per_chord, ticks_per_beat, seed=None):
     """
     For each chord, we do a random pattern of root/fifth, but the pattern length is random.
     We might also jump an octave. Let’s just fling notes around for each chord duration.
     """
-    track_events = []
+    chords_arr = np.asarray(chords, dtype=np.int32)
+    # at most 5 subdivisions per chord, note_on + note_off each
+    max_events = chords_arr.shape[0] * 5 * 2
+    ticks = np.empty(max_events, np.int32)
+    kinds = np.empty(max_events, np.int8)
+    notes = np.empty(max_events, np.int8)
+    vels = np.empty(max_events, np.int8)
+    if seed is None:
+        seed = int(np.random.default_rng().integers(2**31))
+    n = _bass_kernel(chords_arr, int(beats_per_chord * ticks_per_beat),
+                     seed, ticks, kinds, notes, vels)
+    return ticks[:n], kinds[:n], notes[:n], vels[:n], 1
+
+@njit(cache=True)
+def _bass_kernel(chords, chord_length_ticks, seed, ticks, kinds, notes, vels):
+    np.random.seed(seed)
+    idx = 0
     current_time = 0
-    for chord in chords:
-        chord_root = chord[0]
-        chord_fifth = chord[2]
-        
-        # total chord length in ticks
-        chord_length_ticks = int(beats_per_chord * ticks_per_beat)
-        
+    for i in range(chords.shape[0]):
+        chord_root = chords[i, 0]
+        chord_fifth = chords[i, 2]
+
         # We’ll choose a random sub-division of the chord. E.g. we can do 2 or 3 or 4 hits inside
-        subdivs = random.randint(1, 5)
-        sub_tick_length = chord_length_ticks // subdivs if subdivs > 0 else chord_length_ticks
-        
+        subdivs = np.random.randint(1, 6)
+        sub_tick_length = chord_length_ticks // subdivs
+
         t_start = current_time
         for _ in range(subdivs):
             # pick root or fifth or random chord note
-            if random.random() < 0.7:
+            if np.random.random() < 0.7:
                 note = chord_root
             else:
                 note = chord_fifth
             # Maybe pitch it an octave up or down randomly
-            note += random.choice([-12, 0, 12]) if random.random() < 0.5 else 0
-            
-            velocity = random.randint(50, 100)
-            add_note(track_events, note, velocity, t_start, sub_tick_length, channel=1)
+            if np.random.random() < 0.5:
+                note += (np.random.randint(0, 3) - 1) * 12
+
+            velocity = np.random.randint(50, 101)
+            ticks[idx] = t_start
+            kinds[idx] = 0
+            notes[idx] = note
+            vels[idx] = velocity
+            idx += 1
+            ticks[idx] = t_start + sub_tick_length
+            kinds[idx] = 1
+            notes[idx] = note
+            vels[idx] = velocity
+            idx += 1
             t_start += sub_tick_length
-        
+
         current_time += chord_length_ticks
-    return track_events
+    return idx
 
 #####################################
 # HARMONY TRACK (PAD CHORDS)
 #####################################
-def create_harmony_track_chaos(chords, beats_per_chord, ticks_per_beat):
+def create_harmony_track_chaos(chords, beats_per_chord, ticks_per_beat, seed=None):
     """
     We’ll hold the chord but maybe we do random “arpeggio style” hits within that chord duration.
     """
-    track_events = []
+    chords_arr = np.asarray(chords, dtype=np.int32)
+    # at most 3 presses per chord, 3 arpeggio notes each, note_on + note_off
+    max_events = chords_arr.shape[0] * 3 * 3 * 2
+    ticks = np.empty(max_events, np.int32)
+    kinds = np.empty(max_events, np.int8)
+    notes = np.empty(max_events, np.int8)
+    vels = np.empty(max_events, np.int8)
+    if seed is None:
+        seed = int(np.random.default_rng().integers(2**31))
+    n = _harmony_kernel(chords_arr, int(beats_per_chord * ticks_per_beat),
+                        seed, ticks, kinds, notes, vels)
+    return ticks[:n], kinds[:n], notes[:n], vels[:n], 2
+
+@njit(cache=True)
+def _harmony_kernel(chords, chord_length_ticks, seed, ticks, kinds, notes, vels):
+    np.random.seed(seed)
+    idx = 0
     current_time = 0
-    for chord in chords:
-        chord_length_ticks = int(beats_per_chord * ticks_per_beat)
-        
+    for i in range(chords.shape[0]):
         # random # of times we “press” the chord
-        presses = random.randint(1, 3)
+        presses = np.random.randint(1, 4)
         press_length = chord_length_ticks // presses
-        
+
         time_ptr = current_time
         for _ in range(presses):
             # we might do a random arpeggiation of chord notes
-            chord_notes = chord[:]
-            random.shuffle(chord_notes)
-            for note in chord_notes:
-                velocity = random.randint(40, 90)
-                # each note is short if we do an arpeggio; let's do press_length / #chord_notes
-                note_dur = press_length // len(chord_notes)
-                
-                add_note(track_events, note, velocity, time_ptr, note_dur, channel=2)
+            arp_order = np.random.permutation(3)
+            # each note is short if we do an arpeggio; let's do press_length / #chord_notes
+            note_dur = press_length // 3
+            for j in range(3):
+                note = chords[i, arp_order[j]]
+                velocity = np.random.randint(40, 91)
+                ticks[idx] = time_ptr
+                kinds[idx] = 0
+                notes[idx] = note
+                vels[idx] = velocity
+                idx += 1
+                ticks[idx] = time_ptr + note_dur
+                kinds[idx] = 1
+                notes[idx] = note
+                vels[idx] = velocity
+                idx += 1
                 time_ptr += note_dur
-        
+
         current_time += chord_length_ticks
-    
-    return track_events
+
+    return idx
 
 #####################################
 # CHAOTIC PHRASE-BASED MELODY with L-SYSTEM
 #####################################
 def lsystem_durations(depth=3):
     """We'll generate durations from an L-system for extra chaos!"""
-    axiom = "A"
-    rules = {
-        'A': 'AB',
-        'B': 'A'
-    }
-    out = l_system(axiom, rules, depth)
-    # interpret each char as quarter (A) or eighth (B)
-    durations = []
-    for c in out:
-        if c == 'A':
-            durations.append(1.0)
-        else:
-            durations.append(0.5)
-    return durations
+    # symbols as ints: A=0 -> AB, B=1 -> A (Fibonacci growth)
+    rules = [np.array([0, 1], dtype=np.int8), np.array([0], dtype=np.int8)]
+    out = l_system([0], rules, depth)
+    # interpret each symbol as quarter (A) or eighth (B), vectorized
+    return np.where(out == 0, 1.0, 0.5)
 
-def create_melody_track_chaos(chords, scale_notes, beats_per_chord, ticks_per_beat):
+def create_melody_track_chaos(chords, scale_notes, beats_per_chord, ticks_per_beat, seed=None):
     """
     We'll fill melody by referencing chord roots or scale notes at random.
     We'll also incorporate an L-system to vary durations. 
     We'll chain these across the entire chord progression.
     """
-    track_events = []
+    rng = np.random.default_rng(seed)
+    # generate a random L-system pattern (already a float64 array)
+    durations = lsystem_durations(depth=int(rng.integers(2, 6)))
+    chords_arr = np.asarray(chords, dtype=np.int32)
+    scale_arr = np.asarray(scale_notes, dtype=np.int32)
+    # at most 6 notes per chord, note_on + note_off each
+    max_events = chords_arr.shape[0] * 6 * 2
+    ticks = np.empty(max_events, np.int32)
+    kinds = np.empty(max_events, np.int8)
+    notes = np.empty(max_events, np.int8)
+    vels = np.empty(max_events, np.int8)
+    n = _melody_kernel(chords_arr.shape[0], scale_arr, durations,
+                       int(beats_per_chord * ticks_per_beat), ticks_per_beat,
+                       int(rng.integers(2**31)), ticks, kinds, notes, vels)
+    return ticks[:n], kinds[:n], notes[:n], vels[:n], 0
+
+@njit(cache=True)
+def _melody_kernel(num_chords, scale_notes, durations, chord_length_ticks,
+                   ticks_per_beat, seed, ticks, kinds, notes, vels):
+    np.random.seed(seed)
+    idx = 0
     current_time = 0
-    
-    # generate a random L-system pattern
-    durations_list = lsystem_durations(depth=random.randint(2,5))
-    
+
     # random phrase: let's define a random mini-phrase in scale indices
     # e.g. 5 notes
-    phrase_length = random.randint(3, 7)
-    phrase = [random.randint(0, len(scale_notes)-1) for _ in range(phrase_length)]
-    
+    phrase_length = np.random.randint(3, 8)
+    phrase = np.empty(phrase_length, np.int32)
+    for i in range(phrase_length):
+        phrase[i] = np.random.randint(0, len(scale_notes))
+
     lsys_idx = 0
-    
-    for chord in chords:
-        chord_length_ticks = int(beats_per_chord * ticks_per_beat)
-        
+
+    for _ in range(num_chords):
         # subdivide chord length into random # of notes from the phrase
-        notes_in_this_chord = random.randint(2, 6)
-        sub_tick = chord_length_ticks // notes_in_this_chord if notes_in_this_chord else chord_length_ticks
-        
+        notes_in_this_chord = np.random.randint(2, 7)
+        sub_tick = chord_length_ticks // notes_in_this_chord
+
         for _ in range(notes_in_this_chord):
-            # pick a note from the phrase
-            note_idx = random.choice(phrase)
-            # map to actual scale note
-            note = scale_notes[note_idx]
+            # pick a note from the phrase, map to actual scale note
+            note = scale_notes[phrase[np.random.randint(0, phrase_length)]]
             # maybe shift the note up or down an octave with small probability
-            if random.random() < 0.2:
+            if np.random.random() < 0.2:
                 note += 12
-            elif random.random() < 0.2:
+            elif np.random.random() < 0.2:
                 note -= 12
-            
+
             # use next L-system duration
-            dur_beats = durations_list[lsys_idx % len(durations_list)]
+            dur_beats = durations[lsys_idx % len(durations)]
             lsys_idx += 1
             note_dur_ticks = int(dur_beats * ticks_per_beat)
-            
+
             # But let's not exceed sub_tick or chord length. We'll min() them.
             duration = min(note_dur_ticks, sub_tick)
-            velocity = random.randint(60, 127)
-            
-            add_note(track_events, note, velocity, current_time, duration, channel=0)
+            velocity = np.random.randint(60, 128)
+
+            ticks[idx] = current_time
+            kinds[idx] = 0
+            notes[idx] = note
+            vels[idx] = velocity
+            idx += 1
+            ticks[idx] = current_time + duration
+            kinds[idx] = 1
+            notes[idx] = note
+            vels[idx] = velocity
+            idx += 1
             current_time += duration
-    
-    return track_events
+
+    return idx
 
 #####################################
 # COMBINE + WRITE
 #####################################
-def combine_and_write_midi(tracks_dict, filename="holy_random.mid", tempo_bpm=120):
-    mid = MidiFile(ticks_per_beat=TICKS_PER_BEAT)
-    
-    # Master track for tempo
-    tempo_track = MidiTrack()
-    mid.tracks.append(tempo_track)
+END_OF_TRACK = b'\x00\xff\x2f\x00'
+
+def combine_and_write_midi(tracks_dict, filename="holy_random.mid", tempo_bpm=120, rng=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    # Master track for tempo (set_tempo meta event, then end_of_track)
     microseconds_per_beat = int(60000000 / tempo_bpm)
-    tempo_track.append(MetaMessage('set_tempo', tempo=microseconds_per_beat, time=0))
-    
-    # Create a separate MIDI track for each in dict
-    for name, events in tracks_dict.items():
-        track = MidiTrack()
-        mid.tracks.append(track)
-        
+    tempo_track = bytearray(b'\x00\xff\x51\x03')
+    tempo_track += microseconds_per_beat.to_bytes(3, 'big')
+    tempo_track += END_OF_TRACK
+    track_chunks = [tempo_track]
+
+    # Serialize each track straight into a bytearray: VLQ delta, then the
+    # event bytes. All events are note_on on one channel (note_off is sent
+    # as note_on with velocity 0), so running status lets us omit the
+    # status byte on every event after the first.
+    for name, (tick, kind, note, vel, chan) in tracks_dict.items():
+        buf = bytearray()
+
         # random instrument for each track (except drums channel 9)
         if name == "Drums":
-            add_program_change(track, 0, channel=9, time=0)  # Standard drums
+            add_program_change(buf, 0, channel=9, time=0)  # Standard drums
         else:
-            program_num = random.choice(RANDOM_INSTRUMENTS)
-            chan = 0
-            if name == "Bass":
-                chan = 1
-            elif name == "Harmony":
-                chan = 2
-            elif name == "Melody":
-                chan = 0
-            add_program_change(track, program_num, channel=chan, time=0)
-        
-        events_sorted = sorted(events, key=lambda e: e[0])
+            program_num = int(rng.choice(RANDOM_INSTRUMENTS))
+            add_program_change(buf, program_num, channel=chan, time=0)
+
+        # No sort needed here: bass/harmony/melody emit monotonically
+        # increasing ticks by construction, and the drum generator sorts
+        # its own columns before returning.
+        status = 0x90 | chan
+        last_status = -1
         prev_time = 0
-        for e in events_sorted:
-            abs_time, ev_type, note, vel, chan = e
-            delta = abs_time - prev_time
-            if ev_type == "note_on":
-                msg = Message("note_on", note=note, velocity=vel, time=delta, channel=chan)
-            else:
-                msg = Message("note_off", note=note, velocity=vel, time=delta, channel=chan)
-            track.append(msg)
+        for abs_time, ev_kind, n, v in zip(tick.tolist(),
+                                           kind.tolist(),
+                                           note.tolist(),
+                                           vel.tolist()):
+            write_vlq(abs_time - prev_time, buf)
+            if status != last_status:
+                buf.append(status)
+                last_status = status
+            buf.append(n)
+            buf.append(0 if ev_kind else v)
             prev_time = abs_time
-        
-        track.append(MetaMessage("end_of_track", time=0))
-    
-    mid.save(filename)
+
+        buf += END_OF_TRACK
+        track_chunks.append(buf)
+
+    with open(filename, 'wb') as f:
+        f.write(struct.pack('>4sIHHH', b'MThd', 6, 1,
+                            len(track_chunks), TICKS_PER_BEAT))
+        for buf in track_chunks:
+            f.write(struct.pack('>4sI', b'MTrk', len(buf)))
+            f.write(buf)
     print(f"Woo! Chaotic MIDI file created: {filename}  ~> Let the cosmic swirling commence!")
 
 #####################################
@@ -364,6 +472,9 @@ if __name__ == "__main__":
     print(">>> Welcome to the Chaotic Randomized Generator!")
     print("   'Behold the illusions!'")
     print()
+
+    # one PCG64 stream for the whole run; seed it here for reproducible chaos
+    rng = np.random.default_rng()
     
     # Step 1: ask user how many measures? Or random for them
     user_input = input("How many measures of madness do you desire? (Enter a number or press Enter for random up to 16): ")
@@ -371,9 +482,9 @@ if __name__ == "__main__":
         try:
             total_measures = int(user_input.strip())
         except:
-            total_measures = random.randint(4, 16)
+            total_measures = int(rng.integers(4, 17))
     else:
-        total_measures = random.randint(4, 16)
+        total_measures = int(rng.integers(4, 17))
     
     # Step 2: ask user for beats per measure or we do random polyrhythms
     user_input_bpm = input("Beats per measure? (4 = standard, or go nuts, e.g. 7, 9...) Press Enter for random: ")
@@ -381,9 +492,9 @@ if __name__ == "__main__":
         try:
             beats_per_measure = int(user_input_bpm.strip())
         except:
-            beats_per_measure = random.randint(3, 9)
+            beats_per_measure = int(rng.integers(3, 10))
     else:
-        beats_per_measure = random.randint(3, 9)
+        beats_per_measure = int(rng.integers(3, 10))
     
     # Step 3: pick a random tempo or ask user
     user_input_tempo = input("Tempo (BPM)? (Enter or 0 for random): ")
@@ -391,14 +502,14 @@ if __name__ == "__main__":
         try:
             user_tempo = int(user_input_tempo.strip())
             if user_tempo < 1:
-                user_tempo = random.randint(60,180)
+                user_tempo = int(rng.integers(60, 181))
         except:
-            user_tempo = random.randint(60,180)
+            user_tempo = int(rng.integers(60, 181))
     else:
-        user_tempo = random.randint(60,180)
+        user_tempo = int(rng.integers(60, 181))
     
     # Step 4: Build random chord progression
-    chords, scale_info = get_random_chord_progression(num_chords=total_measures)
+    chords, scale_info = get_random_chord_progression(num_chords=total_measures, rng=rng)
     print(f"Chord progression in {scale_info} with {len(chords)} chords. Hallelujah!")
     
     # Step 5: Actually define how many beats each chord gets
@@ -407,51 +518,47 @@ if __name__ == "__main__":
     # We'll do something simpler for clarity: 1 chord / measure
     beats_per_chord = float(beats_per_measure)
     
-    # Step 6: Drums
-    drum_track = create_drum_track_chaos(num_measures=total_measures,
-                                         beats_per_measure=beats_per_measure,
-                                         ticks_per_beat=TICKS_PER_BEAT)
-    
-    # Step 7: Bass
-    bass_track = create_bass_track_chaos(chords, beats_per_chord, TICKS_PER_BEAT)
-    
-    # Step 8: Harmony
-    harmony_track = create_harmony_track_chaos(chords, beats_per_chord, TICKS_PER_BEAT)
-    
-    # Step 9: Build a scale from the chord progression root (or just random) 
+    # Step 6: Build a scale from the chord progression root (or just random)
     # We already have a random scale from get_random_chord_progression, but we only used that for chords.
     # Let’s do a separate random scale for the melody, or we can glean from the chord progression root.
-    
+
     # For maximum chaos, let's just pick 2 octaves from random note name, random mode intervals
-    scale_mode_intervals = random.choice([
+    possible_scales = [
         [0,2,4,5,7,9,11],  # major
         [0,2,3,5,7,8,10],  # minor
         [0,1,3,5,7,8,10],  # phrygian
         [0,2,4,6,7,9,11],  # lydian
         [0,2,4,7,9],       # pentatonic
-    ])
-    random_root_name = random.choice(['C','C#','D','D#','E','F','F#','G','G#','A','A#','B'])
-    random_root_oct = random.randint(3,5)
+    ]
+    scale_mode_intervals = possible_scales[rng.integers(len(possible_scales))]
+    random_root_name = str(rng.choice(['C','C#','D','D#','E','F','F#','G','G#','A','A#','B']))
+    random_root_oct = int(rng.integers(3, 6))
     random_root_midi = note_name_to_midi(random_root_name, random_root_oct)
+
+    # build scale notes: broadcast intervals across two octaves in one shot
+    intervals = np.asarray(scale_mode_intervals, dtype=np.int32)
+    octs = np.array([0, 12], dtype=np.int32)
+    scale_notes = (random_root_midi + octs[:, None] + intervals[None, :]).ravel()
+
+    # Steps 7-10: Drums, Bass, Harmony, Melody. The four generators are
+    # independent, and the njit kernels release the GIL in nopython mode,
+    # so run them on a thread pool. Each kernel gets its own seed so the
+    # random streams don't collide across threads.
+    base_seed = int(rng.integers(2**31))
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {
+            "Drums": ex.submit(create_drum_track_chaos, total_measures,
+                               beats_per_measure, TICKS_PER_BEAT, base_seed),
+            "Bass": ex.submit(create_bass_track_chaos, chords,
+                              beats_per_chord, TICKS_PER_BEAT, base_seed ^ 1),
+            "Harmony": ex.submit(create_harmony_track_chaos, chords,
+                                 beats_per_chord, TICKS_PER_BEAT, base_seed ^ 2),
+            "Melody": ex.submit(create_melody_track_chaos, chords, scale_notes,
+                                beats_per_chord, TICKS_PER_BEAT, base_seed ^ 3),
+        }
+        tracks = {name: f.result() for name, f in futures.items()}
     
-    # build scale notes
-    scale_notes = []
-    for oct_shift in [0, 1]:
-        for interval in scale_mode_intervals:
-            scale_notes.append(random_root_midi + interval + 12*oct_shift)
-    
-    # Step 10: Melody
-    melody_track = create_melody_track_chaos(chords, scale_notes, beats_per_chord, TICKS_PER_BEAT)
-    
-    # Step 11: Combine
-    tracks = {
-        "Drums": drum_track,
-        "Bass": bass_track,
-        "Harmony": harmony_track,
-        "Melody": melody_track
-    }
-    
-    # Step 12: Save
+    # Step 11: Save
     default_filename = "holy_random.mid"
     user_input_name = input("Name this ephemeral masterpiece? (press Enter for 'holy_random.mid'): ").strip()
     if user_input_name:
@@ -462,5 +569,5 @@ if __name__ == "__main__":
         out_name = default_filename
     
     print("Summoning the cosmic frequencies... hold on tight!")
-    combine_and_write_midi(tracks, filename=out_name, tempo_bpm=user_tempo)
+    combine_and_write_midi(tracks, filename=out_name, tempo_bpm=user_tempo, rng=rng)
     print("All done. Embrace the swirling madness and let your ears decipher the illusions!")